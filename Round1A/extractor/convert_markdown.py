@@ -10,80 +10,107 @@ Example:
     python convert_markdown.py document.md --lines-per-page 40 --pretty
 """
 
-import argparse
-import json
 import sys
 import os
-from pathlib import Path
-from markdown_parser import MarkdownParser, parse_markdown_to_json
+from types import SimpleNamespace
 
+_USAGE = """usage: convert_markdown.py input_file [output_file] [options]
+
+Convert Markdown files to JSON format with document outline extraction.
+
+positional arguments:
+  input_file            Input Markdown file path
+  output_file           Output JSON file path (optional, defaults to input_file.json)
+
+options:
+  -h, --help            Show this help message and exit
+  --lines-per-page N    Estimated lines per page for page number calculation (default: 50)
+  --pretty              Pretty-print JSON output with indentation
+  --stdout              Output JSON to stdout instead of file
+  --validate            Validate output against schema and show validation results
+  --verbose, -v         Enable verbose output
+  --encoding ENC        File encoding (default: utf-8)
 
-def main():
-    """Main function for command-line interface."""
-    parser = argparse.ArgumentParser(
-        description="Convert Markdown files to JSON format with document outline extraction.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
 Examples:
-  %(prog)s document.md
-  %(prog)s document.md output.json
-  %(prog)s document.md output.json --lines-per-page 50
-  %(prog)s document.md --pretty --lines-per-page 40
-  %(prog)s document.md --stdout
-        """
-    )
+  convert_markdown.py document.md
+  convert_markdown.py document.md output.json
+  convert_markdown.py document.md output.json --lines-per-page 50
+  convert_markdown.py document.md --pretty --lines-per-page 40
+  convert_markdown.py document.md --stdout"""
 
-    # Positional arguments
-    parser.add_argument(
-        'input_file',
-        help='Input Markdown file path'
-    )
 
-    parser.add_argument(
-        'output_file',
-        nargs='?',
-        help='Output JSON file path (optional, defaults to input_file.json)'
-    )
+def _arg_error(message):
+    print(f"Error: {message}", file=sys.stderr)
+    print(_USAGE, file=sys.stderr)
+    sys.exit(2)
 
-    # Optional arguments
-    parser.add_argument(
-        '--lines-per-page',
-        type=int,
-        default=50,
-        help='Estimated lines per page for page number calculation (default: 50)'
-    )
 
-    parser.add_argument(
-        '--pretty',
-        action='store_true',
-        help='Pretty-print JSON output with indentation'
-    )
+def _parse_args(argv):
+    """
+    Minimal hand-rolled argument parser.
 
-    parser.add_argument(
-        '--stdout',
-        action='store_true',
-        help='Output JSON to stdout instead of file'
+    A one-shot CLI pays the argparse import and parser construction on
+    every invocation, which dominates cold-start for small documents; a
+    plain argv walk keeps the same flags at a fraction of the cost.
+    """
+    args = SimpleNamespace(
+        input_file=None,
+        output_file=None,
+        lines_per_page=50,
+        pretty=False,
+        stdout=False,
+        validate=False,
+        verbose=False,
+        encoding='utf-8',
     )
+    positionals = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ('-h', '--help'):
+            print(_USAGE)
+            sys.exit(0)
+        elif arg == '--lines-per-page':
+            i += 1
+            if i >= len(argv):
+                _arg_error("--lines-per-page requires a value")
+            try:
+                args.lines_per_page = int(argv[i])
+            except ValueError:
+                _arg_error(f"invalid --lines-per-page value: '{argv[i]}'")
+        elif arg == '--encoding':
+            i += 1
+            if i >= len(argv):
+                _arg_error("--encoding requires a value")
+            args.encoding = argv[i]
+        elif arg == '--pretty':
+            args.pretty = True
+        elif arg == '--stdout':
+            args.stdout = True
+        elif arg == '--validate':
+            args.validate = True
+        elif arg in ('--verbose', '-v'):
+            args.verbose = True
+        elif arg.startswith('-'):
+            _arg_error(f"unrecognized argument: '{arg}'")
+        else:
+            positionals.append(arg)
+        i += 1
 
-    parser.add_argument(
-        '--validate',
-        action='store_true',
-        help='Validate output against schema and show validation results'
-    )
+    if not positionals:
+        _arg_error("input_file is required")
+    if len(positionals) > 2:
+        _arg_error(f"unexpected argument: '{positionals[2]}'")
 
-    parser.add_argument(
-        '--verbose', '-v',
-        action='store_true',
-        help='Enable verbose output'
-    )
+    args.input_file = positionals[0]
+    if len(positionals) > 1:
+        args.output_file = positionals[1]
+    return args
 
-    parser.add_argument(
-        '--encoding',
-        default='utf-8',
-        help='File encoding (default: utf-8)'
-    )
 
-    args = parser.parse_args()
+def main():
+    """Main function for command-line interface."""
+    args = _parse_args(sys.argv[1:])
 
     # Validate input file
     if not os.path.exists(args.input_file):
@@ -96,8 +123,7 @@ Examples:
 
     # Determine output file
     if args.output_file is None and not args.stdout:
-        input_path = Path(args.input_file)
-        args.output_file = str(input_path.with_suffix('.json'))
+        args.output_file = os.path.splitext(args.input_file)[0] + '.json'
 
     if args.verbose:
         print(f"Input file: {args.input_file}")
@@ -106,6 +132,16 @@ Examples:
         print(f"Lines per page: {args.lines_per_page}")
         print(f"Encoding: {args.encoding}")
 
+    # Imported only once the arguments validate, keeping --help and error
+    # exits as cheap as possible
+    import json
+    from markdown_parser import MarkdownParser
+
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
     try:
         # Parse the markdown file
         if args.verbose:
@@ -117,15 +153,10 @@ Examples:
         with open(args.input_file, 'r', encoding=args.encoding) as file:
             content = file.read()
 
-        # Parse with page estimation
+        # Parse with page estimation; header detection is identical in the
+        # basic parser, so an empty outline would stay empty on a re-parse
         result = markdown_parser.parse_with_page_estimation(content, args.lines_per_page)
 
-        # If no headers found, try basic parsing
-        if not result["outline"]:
-            if args.verbose:
-                print("No headers found with page estimation, trying basic parsing...")
-            result = markdown_parser.parse_markdown_content(content)
-
         if args.verbose:
             print(f"Found {len(result['outline'])} headers")
             print(f"Document title: {result['title']}")
@@ -139,18 +170,28 @@ Examples:
             else:
                 print("✅ Output validates successfully!")
 
-        # Prepare JSON output
-        if args.pretty:
-            json_output = json.dumps(result, indent=2, ensure_ascii=False)
+        # Prepare JSON output as UTF-8 bytes (orjson serializes 2-3x faster
+        # than the stdlib and emits UTF-8 natively)
+        if orjson is not None:
+            json_output = orjson.dumps(result, option=orjson.OPT_INDENT_2 if args.pretty else 0)
+        elif args.pretty:
+            json_output = json.dumps(result, indent=2, ensure_ascii=False).encode('utf-8')
         else:
-            json_output = json.dumps(result, ensure_ascii=False)
+            json_output = json.dumps(result, ensure_ascii=False).encode('utf-8')
 
         # Output results
         if args.stdout:
-            print(json_output)
+            print(json_output.decode('utf-8'))
         else:
-            with open(args.output_file, 'w', encoding=args.encoding) as file:
-                file.write(json_output)
+            # Write the bytes through a raw fd; going via an io buffer
+            # would copy the whole payload once more before the syscall
+            fd = os.open(args.output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(json_output)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
 
             if args.verbose:
                 print(f"Output written to: {args.output_file}")
@@ -164,9 +205,6 @@ Examples:
         print(f"Error: Cannot decode file with encoding '{args.encoding}': {e}", file=sys.stderr)
         print("Try specifying a different encoding with --encoding", file=sys.stderr)
         sys.exit(1)
-    except json.JSONEncodeError as e:
-        print(f"Error: Cannot encode result as JSON: {e}", file=sys.stderr)
-        sys.exit(1)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -1,15 +1,24 @@
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
 import fitz  # PyMuPDF
-from huggingface_hub import hf_hub_download
-from doclayout_yolo import YOLOv10
 import numpy as np
 from PIL import Image
 
-# Download and load the YOLOv10 model (do this once)
-filepath = hf_hub_download(
-    repo_id="juliozhao/DocLayout-YOLO-DocStructBench",
-    filename="doclayout_yolo_docstructbench_imgsz1024.pt"
-)
-model = YOLOv10(filepath)
+
+@functools.lru_cache(maxsize=1)
+def _get_model():
+    """Download and load the YOLOv10 model on first use (cached singleton)."""
+    # Imported here so importing this module stays cheap; the weights are
+    # hundreds of MB and only needed when classify_headings actually runs
+    from huggingface_hub import hf_hub_download
+    from doclayout_yolo import YOLOv10
+
+    filepath = hf_hub_download(
+        repo_id="juliozhao/DocLayout-YOLO-DocStructBench",
+        filename="doclayout_yolo_docstructbench_imgsz1024.pt"
+    )
+    return YOLOv10(filepath)
 
 # Map model class indices to heading levels (update as per model's class mapping)
 CLASS_TO_LEVEL = {
@@ -21,35 +30,116 @@ CLASS_TO_LEVEL = {
 }
 
 
+# Pages per model() call; batching amortizes the fixed per-call
+# preprocessing and kernel-launch overhead across pages
+BATCH_SIZE = 8
+
+# Render resolution; the model downscales to 1024 px anyway, so 96 DPI
+# grayscale carries the same layout signal as 200 DPI RGB at ~6x fewer bytes
+RENDER_DPI = 96
+# Factor to map pixel coordinates at RENDER_DPI back to PDF points (72 DPI)
+_PIX_TO_PDF = 72.0 / RENDER_DPI
+
+
+# Concurrent render workers; each opens its own document handle
+RENDER_WORKERS = 4
+
+
+def _render_page(page):
+    # Render page to a grayscale image, expanded to RGB for the model;
+    # frombytes builds the image straight from the pixmap buffer without
+    # an intermediate NumPy view
+    pix = page.get_pixmap(dpi=RENDER_DPI, colorspace=fitz.csGRAY)
+    return Image.frombytes('L', (pix.width, pix.height), pix.samples).convert('RGB')
+
+
+def _render_chunk(pdf_path, start, stop):
+    # PyMuPDF documents are not thread-safe, so every worker gets a fresh
+    # handle on the file rather than sharing the caller's Document
+    doc = fitz.open(pdf_path)
+    return [_render_page(doc[i]) for i in range(start, stop)]
+
+
 def classify_headings(pdf_path):
     doc = fitz.open(pdf_path)
     outline = []
     title = ""
-    for page_num, page in enumerate(doc, start=1):
-        # Render page to image (RGB)
-        pix = page.get_pixmap(dpi=200, colorspace=fitz.csRGB)
-        img = Image.fromarray(np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n))
-        # Run YOLO model
-        results = model(img)
+    pages = list(doc)
+    # Render page ranges concurrently, one private document handle per
+    # worker (see _render_chunk); results come back in page order
+    images = []
+    if pages:
+        chunk_size = -(-len(pages) // RENDER_WORKERS)
+        with ThreadPoolExecutor(max_workers=RENDER_WORKERS) as executor:
+            futures = [
+                executor.submit(_render_chunk, pdf_path, start, min(start + chunk_size, len(pages)))
+                for start in range(0, len(pages), chunk_size)
+            ]
+            for future in futures:
+                images.extend(future.result())
+    model = _get_model()
+    for start in range(0, len(images), BATCH_SIZE):
+        # Run YOLO model on a batch of pages at once
+        results = model(images[start:start + BATCH_SIZE])
         # Each result contains boxes, class ids, and confidence
-        for box, cls_id, conf in zip(results[0].boxes.xyxy, results[0].boxes.cls, results[0].boxes.conf):
-            level = CLASS_TO_LEVEL.get(int(cls_id), None)
-            if not level:
-                continue
-            # Crop the detected region and extract text using PyMuPDF
-            x1, y1, x2, y2 = map(int, box.tolist())
-            rect = fitz.Rect(x1, y1, x2, y2)
-            text = page.get_textbox(rect).strip()
-            if not text:
-                continue
-            if level == "Title" and not title:
-                title = text
-            else:
-                outline.append({
-                    "level": level,
-                    "text": text,
-                    "page": page_num
-                })
+        for offset, result in enumerate(results):
+            page = pages[start + offset]
+            page_num = start + offset + 1
+            for box, cls_id, conf in zip(result.boxes.xyxy, result.boxes.cls, result.boxes.conf):
+                level = CLASS_TO_LEVEL.get(int(cls_id), None)
+                if not level:
+                    continue
+                # Map the box from render pixels back to PDF points and
+                # extract the text under it using PyMuPDF
+                x1, y1, x2, y2 = (c * _PIX_TO_PDF for c in box.tolist())
+                rect = fitz.Rect(x1, y1, x2, y2)
+                text = page.get_textbox(rect).strip()
+                if not text:
+                    continue
+                if level == "Title" and not title:
+                    title = text
+                else:
+                    outline.append({
+                        "level": level,
+                        "text": text,
+                        "page": page_num
+                    })
     if not title and outline:
         title = outline[0]["text"]
     return {"title": title, "outline": outline}
+
+
+# Sorted font-size thresholds and the level chosen by bisecting into them;
+# searchsorted with side='left' keeps the strict size > threshold semantics
+# (index 0, size <= 12, is body text)
+_SIZE_THRESHOLDS = np.array([12.0, 14.0, 18.0], dtype=np.float32)
+_SIZE_LEVELS = np.array(['', 'H3', 'H2', 'H1'])
+
+
+def classify_headings_by_font(blocks):
+    """
+    Classify headings from pdf_reader blocks using font sizes only.
+
+    The largest font size in the document is treated as the title; smaller
+    sizes map to H1/H2/H3 by fixed thresholds. The blocks are transposed to
+    columnar arrays and every size is bisected into the sorted threshold
+    table in a single vectorized pass instead of a per-block Python loop.
+    """
+    if not blocks:
+        return {"title": "", "outline": []}
+    sizes = np.fromiter((b["size"] for b in blocks), dtype=np.float32, count=len(blocks))
+    texts = [b["text"] for b in blocks]
+    pages = [b["page"] for b in blocks]
+
+    max_size = sizes.max()
+    title = texts[int(sizes.argmax())]
+
+    levels = np.take(_SIZE_LEVELS, np.searchsorted(_SIZE_THRESHOLDS, sizes, side='left'))
+    # Title-sized text is never an outline entry
+    keep = np.flatnonzero((levels != '') & (sizes < max_size)).tolist()
+    levels = levels.tolist()
+    outline = [
+        {"level": levels[i], "text": texts[i], "page": pages[i]}
+        for i in keep
+    ]
+    return {"title": title, "outline": outline}
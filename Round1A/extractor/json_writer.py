@@ -1,5 +1,18 @@
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_output_json(data):
+    """Serialize result data to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def write_output_json(data, output_path):
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(output_path, "wb") as f:
+        f.write(dumps_output_json(data))
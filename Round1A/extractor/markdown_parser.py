@@ -1,16 +1,40 @@
 import re
 import json
-from typing import Dict, List, Any, Optional
+from collections import namedtuple
+from typing import Dict, List, Any, Iterable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Precompiled patterns shared by all parser instances; compiling once at
+# module level avoids per-line trips through the regex cache in the hot loop.
+_HEADER_RE = re.compile(r'^(#{1,6})\s*\**(.*?)\**\s*(?:\[L?\d+-?\d*\])?(?:\s*\[.*?\])?\s*$')
+# Bold / italic / code markers in a single alternation so one sub() pass
+# strips all inline formatting instead of three sequential passes
+_FMT_RE = re.compile(r'\*\*(.*?)\*\*|\*(.*?)\*|`(.*?)`')
+_PAGE_BRACKET_RE = re.compile(r'\[.*?(\d+).*?\]', re.IGNORECASE)  # [L1-2] or [page 1] etc.
+_PAGE_WORD_RE = re.compile(r'page\s*(\d+)', re.IGNORECASE)        # "page 1"
+_PAGE_ABBREV_RE = re.compile(r'p\.?\s*(\d+)', re.IGNORECASE)      # "p. 1" or "p1"
+
+# Hash count to header level, indexed by hash_count - 1
+_LEVEL_MAP = ('H1', 'H2', 'H3', 'H4', 'H5', 'H6')
+
+# Outline entries are accumulated as namedtuples (a fraction of the size of
+# a dict and cheaper to construct) and converted to dicts only when the
+# final JSON structure is assembled
+OutlineItem = namedtuple('OutlineItem', 'level text page')
 
 class MarkdownParser:
     """
     A parser to convert markdown files to JSON format following the specified schema.
     """
 
-    def __init__(self):
-        self.title = ""
-        self.outline = []
-        self.current_page = 1
+    def __init__(self) -> None:
+        self.title: str = ""
+        self.outline: List[OutlineItem] = []
+        self.current_page: int = 1
 
     def parse_markdown_file(self, file_path: str) -> Dict[str, Any]:
         """
@@ -22,10 +46,18 @@ class MarkdownParser:
         Returns:
             Dict[str, Any]: JSON structure with title and outline
         """
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
+        # Read raw bytes and only decode header-candidate lines; body text
+        # (the vast majority of the file) is never decoded to str
+        with open(file_path, 'rb') as file:
+            data = file.read()
+
+        def header_lines():
+            for raw in data.split(b'\n'):
+                raw = raw.strip()
+                if raw[:1] == b'#':
+                    yield raw.decode('utf-8')
 
-        return self.parse_markdown_content(content)
+        return self._parse_lines(header_lines())
 
     def parse_markdown_content(self, content: str) -> Dict[str, Any]:
         """
@@ -34,6 +66,18 @@ class MarkdownParser:
         Args:
             content (str): Markdown content as string
 
+        Returns:
+            Dict[str, Any]: JSON structure with title and outline
+        """
+        return self._parse_lines(content.splitlines())
+
+    def _parse_lines(self, lines: Iterable[str]) -> Dict[str, Any]:
+        """
+        Shared line-scanning loop over an iterable of lines.
+
+        Args:
+            lines: Iterable of lines to scan for headers
+
         Returns:
             Dict[str, Any]: JSON structure with title and outline
         """
@@ -41,39 +85,33 @@ class MarkdownParser:
         self.outline = []
         self.current_page = 1
 
-        lines = content.split('\n')
-
-        for line_num, line in enumerate(lines, 1):
+        for line in lines:
             line = line.strip()
-            if not line:
+            # Headers all start with '#', so a cheap first-byte check skips
+            # the regex engine entirely for body text
+            if not line or line[0] != '#':
                 continue
 
             # Check if it's a header
             header_match = self._parse_header(line)
             if header_match:
-                level, text, page = header_match
-
                 # Set title from first significant header (H1 or H2)
-                if not self.title and level in ['H1', 'H2']:
-                    self.title = text.strip()
+                if not self.title and header_match.level in ['H1', 'H2']:
+                    self.title = header_match.text
 
                 # Add to outline
-                self.outline.append({
-                    "level": level,
-                    "text": text.strip(),
-                    "page": page if page else self.current_page
-                })
+                self.outline.append(header_match)
 
         # If no title was found, try to extract from first outline item
         if not self.title and self.outline:
-            self.title = self.outline[0]["text"]
+            self.title = self.outline[0].text
 
         return {
             "title": self.title,
-            "outline": self.outline
+            "outline": [item._asdict() for item in self.outline]
         }
 
-    def _parse_header(self, line: str) -> Optional[tuple]:
+    def _parse_header(self, line: str) -> Optional[OutlineItem]:
         """
         Parse a header line and extract level, text, and page number.
 
@@ -83,27 +121,22 @@ class MarkdownParser:
         Returns:
             tuple: (level, text, page) or None if not a header
         """
-        # Pattern to match markdown headers with optional line numbers and page info
-        header_pattern = r'^(#{1,6})\s*\**(.*?)\**\s*(?:\[L?\d+-?\d*\])?(?:\s*\[.*?\])?\s*$'
-        match = re.match(header_pattern, line)
+        match = _HEADER_RE.match(line)
 
         if match:
             hash_count = len(match.group(1))
             text = match.group(2).strip()
 
-            # Remove markdown formatting
-            text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)  # Bold
-            text = re.sub(r'\*(.*?)\*', r'\1', text)      # Italic
-            text = re.sub(r'`(.*?)`', r'\1', text)        # Code
+            # Remove markdown formatting (bold, italic, code) in one pass
+            text = _FMT_RE.sub(lambda m: m.group(1) or m.group(2) or m.group(3) or '', text)
 
             # Map hash count to header level
-            level_map = {1: 'H1', 2: 'H2', 3: 'H3', 4: 'H4', 5: 'H5', 6: 'H6'}
-            level = level_map.get(hash_count, 'H1')
+            level = _LEVEL_MAP[hash_count - 1]
 
             # Try to extract page number from line
             page = self._extract_page_number(line)
 
-            return (level, text, page)
+            return OutlineItem(level, text, page)
 
         return None
 
@@ -117,15 +150,22 @@ class MarkdownParser:
         Returns:
             int: Page number or current page
         """
-        # Look for page indicators in various formats
-        page_patterns = [
-            r'\[.*?(\d+).*?\]',  # [L1-2] or [page 1] etc.
-            r'page\s*(\d+)',     # "page 1"
-            r'p\.?\s*(\d+)',     # "p. 1" or "p1"
-        ]
-
-        for pattern in page_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        # Look for page indicators in various formats; almost no headers
+        # carry one, so each pattern is gated behind a cheap substring
+        # check and the common case never reaches the regex engine
+        if '[' in line:
+            match = _PAGE_BRACKET_RE.search(line)
+            if match:
+                return int(match.group(1))
+
+        lower = line.lower()
+        if 'page' in lower:
+            match = _PAGE_WORD_RE.search(line)
+            if match:
+                return int(match.group(1))
+
+        if 'p' in lower:
+            match = _PAGE_ABBREV_RE.search(line)
             if match:
                 return int(match.group(1))
 
@@ -145,44 +185,39 @@ class MarkdownParser:
         self.title = ""
         self.outline = []
 
-        lines = content.split('\n')
-
-        for line_num, line in enumerate(lines, 1):
+        for line_num, line in enumerate(content.splitlines()):
             line = line.strip()
-            if not line:
+            # Same fast path as parse_markdown_content: only lines starting
+            # with '#' can be headers
+            if not line or line[0] != '#':
                 continue
 
-            # Estimate current page
-            estimated_page = max(1, (line_num - 1) // lines_per_page + 1)
+            # Estimate current page; only computed for header candidates
+            estimated_page = line_num // lines_per_page + 1
             self.current_page = estimated_page
 
-            # Check if it's a header
+            # Check if it's a header; _parse_header falls back to the
+            # estimated current_page when the line carries no page tag
             header_match = self._parse_header(line)
             if header_match:
-                level, text, page = header_match
-
                 # Set title from first significant header
-                if not self.title and level in ['H1', 'H2']:
-                    self.title = text.strip()
+                if not self.title and header_match.level in ['H1', 'H2']:
+                    self.title = header_match.text
 
-                # Add to outline with estimated page if no page found
-                self.outline.append({
-                    "level": level,
-                    "text": text.strip(),
-                    "page": page if page != self.current_page else estimated_page
-                })
+                # Add to outline
+                self.outline.append(header_match)
 
         # If no title was found, try to extract from first outline item
         if not self.title and self.outline:
-            self.title = self.outline[0]["text"]
+            self.title = self.outline[0].text
 
         return {
             "title": self.title,
-            "outline": self.outline
+            "outline": [item._asdict() for item in self.outline]
         }
 
 
-def parse_markdown_to_json(input_file: str, output_file: str = None, lines_per_page: int = 50) -> Dict[str, Any]:
+def parse_markdown_to_json(input_file: str, output_file: Optional[str] = None, lines_per_page: int = 50) -> Dict[str, Any]:
     """
     Convenience function to parse markdown file to JSON.
 
@@ -196,19 +231,17 @@ def parse_markdown_to_json(input_file: str, output_file: str = None, lines_per_p
     """
     parser = MarkdownParser()
 
-    # Parse the file
+    # Parse the file; a re-parse with page estimation would detect the
+    # exact same headers, so no fallback pass is needed
     result = parser.parse_markdown_file(input_file)
 
-    # If no headers found, try with page estimation
-    if not result["outline"]:
-        with open(input_file, 'r', encoding='utf-8') as file:
-            content = file.read()
-        result = parser.parse_with_page_estimation(content, lines_per_page)
-
     # Save to output file if specified
     if output_file:
-        with open(output_file, 'w', encoding='utf-8') as file:
-            json.dump(result, file, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as file:
+            if orjson is not None:
+                file.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+            else:
+                file.write(json.dumps(result, indent=2, ensure_ascii=False).encode('utf-8'))
 
     return result
 
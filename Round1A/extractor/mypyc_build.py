@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Optional ahead-of-time compilation of the markdown parser with mypyc.
+
+The parser's hot loop (strip, '#' check, regex match, outline append) is
+pure Python executed once per line; compiling it typically gives 2-4x on
+large documents. Build the extension in place with:
+
+    pip install mypy
+    python mypyc_build.py build_ext --inplace
+
+Nothing else changes: callers import markdown_parser as usual, and the
+interpreted module keeps working wherever no compiled extension exists.
+"""
+
+import os
+import shutil
+import tempfile
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Compile from a scratch directory so mypyc sees markdown_parser as a
+# top-level module rather than part of the extractor package; the scripts
+# in this directory import it top-level, and a package-bound extension
+# would break those imports
+build_dir = tempfile.mkdtemp(prefix="mypyc_markdown_parser_")
+shutil.copy(os.path.join(HERE, "markdown_parser.py"), build_dir)
+os.chdir(build_dir)
+
+setup(
+    name="extractor-compiled",
+    ext_modules=mypycify(["markdown_parser.py"]),
+)
+
+for filename in os.listdir(build_dir):
+    if filename.endswith(".so"):
+        shutil.copy(os.path.join(build_dir, filename), HERE)
+shutil.rmtree(build_dir)
@@ -3,18 +3,25 @@ import fitz  # PyMuPDF
 def extract_blocks_from_pdf(file_path):
     doc = fitz.open(file_path)
     blocks = []
+    blocks_append = blocks.append
     for page_num, page in enumerate(doc, start=1):
-        for block in page.get_text("dict")["blocks"]:
-            if "lines" in block:
-                for line in block["lines"]:
-                    spans = line["spans"]
-                    if spans:
-                        text = "".join(span["text"] for span in spans).strip()
-                        if text:
-                            blocks.append({
-                                "text": text,
-                                "font": spans[0]["font"],
-                                "size": spans[0]["size"],
-                                "page": page_num
-                            })
+        # TEXTFLAGS_TEXT keeps MuPDF from decoding and emitting image
+        # blocks at all, so only text blocks get Python dicts built
+        for block in page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)["blocks"]:
+            if block["type"] != 0 or "lines" not in block:
+                continue
+            for line in block["lines"]:
+                spans = line["spans"]
+                if not spans:
+                    continue
+                # List comprehension feeds str.join its fast materialized path
+                text = "".join([s["text"] for s in spans]).strip()
+                if text:
+                    s0 = spans[0]
+                    blocks_append({
+                        "text": text,
+                        "font": s0["font"],
+                        "size": s0["size"],
+                        "page": page_num
+                    })
     return blocks
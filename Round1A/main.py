@@ -1,16 +1,41 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
 from extractor.heading_classifier import classify_headings
-from extractor.json_writer import write_output_json
+from extractor.json_writer import dumps_output_json
 
 input_dir = os.environ.get("INPUT_DIR", "input")
 output_dir = os.environ.get("OUTPUT_DIR", "output")
 
-os.makedirs(input_dir, exist_ok=True)
-os.makedirs(output_dir, exist_ok=True)
 
-for filename in os.listdir(input_dir):
-    if filename.endswith(".pdf"):
-        input_path = os.path.join(input_dir, filename)
-        result = classify_headings(input_path)
-        output_path = os.path.join(output_dir, filename.replace(".pdf", ".json"))
-        write_output_json(result, output_path)
+def process(filename):
+    input_path = os.path.join(input_dir, filename)
+    result = classify_headings(input_path)
+    output_path = os.path.join(output_dir, filename.replace(".pdf", ".json"))
+    return output_path, dumps_output_json(result)
+
+
+def flush_outputs(pairs):
+    # All output writes happen in one batched pass at the end, each as a
+    # single os.write on a raw fd, so the I/O tail is not interleaved with
+    # (and stalled by) per-PDF compute
+    for output_path, payload in pairs:
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+
+if __name__ == "__main__":
+    os.makedirs(input_dir, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
+
+    filenames = [f for f in os.listdir(input_dir) if f.endswith(".pdf")]
+
+    # Each PDF is CPU-bound and independent, so fan out across cores; a
+    # process pool is required because PyMuPDF and YOLO hold the GIL
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        pairs = list(executor.map(process, filenames))
+    flush_outputs(pairs)